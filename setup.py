@@ -12,9 +12,9 @@ setup(name='lspython',
       author_email='connor@conmason.com',
       license="MIT",
       packages=find_packages(),
-      install_requires=[
-          'prettytable',
-      ],
+      extras_require={
+          'numba': ['numba', 'numpy'],
+      },
       entry_points = {
           'console_scripts': [
               'lspython=lspython.lspython:lspython'